@@ -2,7 +2,11 @@
 Functional analytics module for habit tracking.
 
 This module provides pure functions to analyze habit data.
-No file I/O, no printing, and no state mutation are performed here.
+No file I/O, no printing, and no changes to habit data are performed
+here. The only side effect is memoization: each habit caches its
+completed period indices (Habit.get_period_indices()) the first time a
+streak is calculated. The cache is checked against the habit's current
+completions on every call, so results always reflect edits to them.
 
 Streak definition:
 - A habit is considered completed for a period if it has at least one
@@ -11,11 +15,10 @@ Streak definition:
 - Missing any expected period breaks the streak.
 """
 
-from typing import List, Tuple, Optional
+from typing import Dict, List, Tuple, Optional
 from datetime import datetime
 
 from models.habit import Habit
-from utils.dates import get_period_key, generate_period_keys
 
 
 # ------------------------------------------------------------------
@@ -56,6 +59,39 @@ def list_habits_by_periodicity(
 # Streak calculations
 # ------------------------------------------------------------------
 
+def _longest_run(periods: List[int]) -> int:
+    """
+    Find the longest run of consecutive integers in a sorted sequence.
+
+    This is the inner loop of every streak calculation, so it makes a
+    single pass without allocating intermediate lists.
+
+    Args:
+        periods (List[int]): Sorted, unique period indices.
+
+    Returns:
+        int: Length of the longest run (0 for an empty sequence).
+    """
+    if not periods:
+        return 0
+
+    longest = 1
+    current = 1
+    previous = periods[0]
+
+    for index in range(1, len(periods)):
+        period = periods[index]
+        if period == previous + 1:
+            current += 1
+            if current > longest:
+                longest = current
+        else:
+            current = 1
+        previous = period
+
+    return longest
+
+
 def longest_streak_for_habit(habit: Habit) -> int:
     """
     Calculate the longest streak for a single habit.
@@ -66,36 +102,24 @@ def longest_streak_for_habit(habit: Habit) -> int:
     Returns:
         int: Length of the longest consecutive streak.
     """
-    completions = habit.get_completion_timestamps()
-
-    if not completions:
-        return 0
+    # Completed periods as integer indices; consecutive periods differ
+    # by exactly one, so any gap between sorted indices breaks a run.
+    completed_periods = sorted(habit.get_period_indices())
 
-    # Determine completed periods
-    completed_periods = {
-        get_period_key(dt, habit.periodicity) for dt in completions
-    }
+    return _longest_run(completed_periods)
 
-    start_date = min(completions)
-    end_date = max(completions)
 
-    expected_periods = generate_period_keys(
-        start=start_date,
-        end=end_date,
-        periodicity=habit.periodicity
-    )
-
-    longest_streak = 0
-    current_streak = 0
+def longest_streak_per_habit(habits: List[Habit]) -> Dict[str, int]:
+    """
+    Calculate the longest streak of every habit in one pass.
 
-    for period in expected_periods:
-        if period in completed_periods:
-            current_streak += 1
-            longest_streak = max(longest_streak, current_streak)
-        else:
-            current_streak = 0
+    Args:
+        habits (List[Habit]): List of habits.
 
-    return longest_streak
+    Returns:
+        Dict[str, int]: Longest streak keyed by habit ID.
+    """
+    return {habit.id: longest_streak_for_habit(habit) for habit in habits}
 
 
 def longest_streak_all(
@@ -117,12 +141,28 @@ def longest_streak_all(
 
     best_habit = None
     best_streak = 0
+    best_position = len(habits)
+
+    # A streak can never exceed the number of completed periods, so visit
+    # habits by that upper bound and stop once no habit can reach the best.
+    # Ties go to the habit listed first, as in a plain in-order scan.
+    candidates = sorted(
+        enumerate(habits),
+        key=lambda item: len(item[1].get_period_indices()),
+        reverse=True
+    )
+
+    for position, habit in candidates:
+        if len(habit.get_period_indices()) < best_streak:
+            break
 
-    for habit in habits:
         streak = longest_streak_for_habit(habit)
-        if streak > best_streak:
+        if streak > best_streak or (
+            streak == best_streak and streak > 0 and position < best_position
+        ):
             best_streak = streak
             best_habit = habit
+            best_position = position
 
     if best_habit is None:
         return None
@@ -16,13 +16,6 @@ from typing import List
 
 from models.habit import Habit
 from storage.repository import HabitRepository
-from analytics.analytics import (
-    list_all_habits,
-    list_habits_by_periodicity,
-    longest_streak_all,
-    longest_streak_for_habit,
-)
-from seed.fixtures import load_fixture_habits
 from utils.validators import (
     validate_habit_name,
     validate_periodicity,
@@ -126,6 +119,14 @@ def analytics_menu(repository: HabitRepository) -> None:
     """
     Show analytics submenu.
     """
+    # Imported lazily so plain CRUD sessions never load analytics
+    from analytics.analytics import (
+        list_all_habits,
+        list_habits_by_periodicity,
+        longest_streak_all,
+        longest_streak_for_habit,
+    )
+
     habits = repository.load_all()
 
     if not habits:
@@ -189,6 +190,8 @@ def load_fixtures(repository: HabitRepository) -> None:
     """
     Load predefined habits with 4 weeks of fixture data.
     """
+    from seed.fixtures import load_fixture_habits
+
     habits = load_fixture_habits()
     repository.save_all(habits)
     print("✔ Predefined habits loaded successfully.\n")
@@ -7,14 +7,18 @@ Responsibilities:
 3. Optionally load predefined habits (fixtures) on first run
 4. Launch the Command Line Interface (CLI)
 
+Options:
+    --pretty    Write data/habits.json indented for human readers
+
 Python version: 3.7+
 """
 
+import argparse
 from pathlib import Path
+from typing import List, Optional
 
 from storage.json_store import JsonHabitRepository
-from seed.fixtures import load_fixture_habits
-from cli.cli import run_cli
+from storage.repository import CachingHabitRepository, HabitRepository
 
 
 DATA_DIR = Path("data")
@@ -28,16 +32,17 @@ def ensure_data_directory() -> None:
     DATA_DIR.mkdir(exist_ok=True)
 
 
-def first_run_prompt(repository: JsonHabitRepository) -> None:
+def first_run_prompt(repository: HabitRepository) -> None:
     """
     Offer to load predefined habits with 4 weeks of example data
     if no habits exist yet.
     """
-    existing_habits = repository.load_all()
-
-    if existing_habits:
+    if not repository.is_empty():
         return
 
+    # Imported lazily: fixture data is only needed on first run
+    from seed.fixtures import load_fixture_habits
+
     print("\nNo habits found (first run detected).")
     print("Would you like to load 5 predefined habits with 4 weeks of example data?")
     print("1) Yes (recommended)")
@@ -53,13 +58,40 @@ def first_run_prompt(repository: JsonHabitRepository) -> None:
         print("✔ Starting with an empty habit tracker.\n")
 
 
-def main() -> None:
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """
+    Parse command line options.
+
+    Args:
+        argv (List[str], optional): Arguments to parse.
+                                    Defaults to sys.argv[1:].
+
+    Returns:
+        argparse.Namespace: Parsed options.
+    """
+    parser = argparse.ArgumentParser(description="Habit Tracker CLI")
+    parser.add_argument(
+        "--pretty",
+        action="store_true",
+        help="write data/habits.json indented for human readers",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
     """
     Application bootstrap function.
     """
+    args = parse_args(argv)
+
     ensure_data_directory()
 
-    repository = JsonHabitRepository(DATA_FILE)
+    # Imported lazily so the CLI dependency chain loads after setup
+    from cli.cli import run_cli
+
+    repository = CachingHabitRepository(
+        JsonHabitRepository(DATA_FILE, pretty=args.pretty)
+    )
 
     first_run_prompt(repository)
 
@@ -23,6 +23,9 @@ class Completion:
         completed_at (datetime): Timestamp when the habit was completed.
     """
 
+    # Declared manually (not slots=True) to stay compatible with 3.7
+    __slots__ = ("habit_id", "completed_at")
+
     habit_id: str
     completed_at: datetime
 
@@ -12,9 +12,11 @@ by the analytics module.
 
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import List, Dict
+from typing import List, Dict, Optional, Set
 from uuid import uuid4
 
+from utils.dates import get_period_index
+
 
 ALLOWED_PERIODICITIES = {"daily", "weekly"}
 
@@ -45,6 +47,11 @@ class Habit:
         self._validate_name()
         self._validate_periodicity()
 
+        # Incrementally maintained cache for get_period_indices()
+        self._period_index_cache: Set[int] = set()
+        self._period_index_snapshot: List[datetime] = []
+        self._period_index_periodicity: Optional[str] = None
+
     # ------------------------------------------------------------------
     # Validation helpers
     # ------------------------------------------------------------------
@@ -92,12 +99,51 @@ class Habit:
 
     def get_completion_timestamps(self) -> List[datetime]:
         """
-        Return a copy of completion timestamps.
+        Return the completion timestamps without copying them.
+
+        The returned list is the habit's own list and must be treated
+        as read-only; use check_off() to add completions.
 
         Returns:
             List[datetime]: Completion timestamps.
         """
-        return list(self.completions)
+        return self.completions
+
+    def get_period_indices(self) -> Set[int]:
+        """
+        Return the integer indices of all periods with a completion.
+
+        The set is cached together with a snapshot of the completions it
+        was built from. Each call compares the completions against that
+        snapshot and maps only the ones appended since; if any earlier
+        completion was edited, removed or replaced, or the periodicity
+        changed, the set is rebuilt. Callers must not modify it.
+
+        Returns:
+            Set[int]: Period indices (see utils.dates.get_period_index).
+        """
+        completions = self.completions
+        snapshot = self._period_index_snapshot
+        count = len(snapshot)
+
+        if (
+            self._period_index_periodicity != self.periodicity
+            or len(completions) < count
+            or completions[:count] != snapshot
+        ):
+            self._period_index_cache = set()
+            self._period_index_snapshot = snapshot = []
+            self._period_index_periodicity = self.periodicity
+            count = 0
+
+        if len(completions) > count:
+            appended = completions[count:]
+            self._period_index_cache.update(
+                get_period_index(dt, self.periodicity) for dt in appended
+            )
+            snapshot.extend(appended)
+
+        return self._period_index_cache
 
     def has_completions(self) -> bool:
         """
@@ -143,8 +189,9 @@ class Habit:
             name=data["name"],
             periodicity=data["periodicity"],
             created_at=datetime.fromisoformat(data["created_at"]),
-            completions=[
-                datetime.fromisoformat(ts) for ts in data.get("completions", [])
-            ],
+            # map() keeps the per-timestamp parse loop in C
+            completions=list(
+                map(datetime.fromisoformat, data.get("completions", []))
+            ),
         )
         return habit
@@ -10,11 +10,14 @@ The fixtures are intended for:
 - Unit tests (stable, repeatable results)
 - Validation of streak logic
 
-All dates are fixed to ensure deterministic behavior.
+All dates are fixed to ensure deterministic behavior. Because of that,
+the generated completion timestamps are memoized; every call to
+load_fixture_habits() still returns new Habit objects and lists.
 """
 
 from datetime import datetime, timedelta
-from typing import List
+from functools import lru_cache
+from typing import List, Tuple
 
 from models.habit import Habit
 
@@ -23,54 +26,56 @@ from models.habit import Habit
 FIXTURE_START_DATE = datetime(2024, 1, 1)  # 2024-01-01 is a Monday
 
 
+@lru_cache(maxsize=None)
 def _generate_daily_completions(
     start: datetime,
     days: int,
-    skip_days: List[int] = None
-) -> List[datetime]:
+    skip_days: Tuple[int, ...] = ()
+) -> Tuple[datetime, ...]:
     """
     Generate daily completion timestamps.
 
     Args:
         start (datetime): Start date.
         days (int): Number of days to generate.
-        skip_days (List[int], optional): Day indices to skip (0-based).
+        skip_days (Tuple[int, ...], optional): Day indices to skip (0-based).
 
     Returns:
-        List[datetime]: Completion timestamps.
+        Tuple[datetime, ...]: Completion timestamps (cached, immutable).
     """
-    skip_days = skip_days or []
+    skip = set(skip_days)
     completions = []
 
     for i in range(days):
-        if i not in skip_days:
+        if i not in skip:
             completions.append(start + timedelta(days=i, hours=9))
-    return completions
+    return tuple(completions)
 
 
+@lru_cache(maxsize=None)
 def _generate_weekly_completions(
     start: datetime,
     weeks: int,
-    skip_weeks: List[int] = None
-) -> List[datetime]:
+    skip_weeks: Tuple[int, ...] = ()
+) -> Tuple[datetime, ...]:
     """
     Generate weekly completion timestamps.
 
     Args:
         start (datetime): Start date (assumed Monday).
         weeks (int): Number of weeks to generate.
-        skip_weeks (List[int], optional): Week indices to skip (0-based).
+        skip_weeks (Tuple[int, ...], optional): Week indices to skip (0-based).
 
     Returns:
-        List[datetime]: Completion timestamps.
+        Tuple[datetime, ...]: Completion timestamps (cached, immutable).
     """
-    skip_weeks = skip_weeks or []
+    skip = set(skip_weeks)
     completions = []
 
     for i in range(weeks):
-        if i not in skip_weeks:
+        if i not in skip:
             completions.append(start + timedelta(weeks=i, hours=10))
-    return completions
+    return tuple(completions)
 
 
 def load_fixture_habits() -> List[Habit]:
@@ -94,9 +99,9 @@ def load_fixture_habits() -> List[Habit]:
         periodicity="daily",
         created_at=FIXTURE_START_DATE
     )
-    habit_1.completions = _generate_daily_completions(
+    habit_1.completions = list(_generate_daily_completions(
         FIXTURE_START_DATE, days=28
-    )
+    ))
 
     # 2. Daily habit – missed some days
     habit_2 = Habit(
@@ -104,11 +109,11 @@ def load_fixture_habits() -> List[Habit]:
         periodicity="daily",
         created_at=FIXTURE_START_DATE
     )
-    habit_2.completions = _generate_daily_completions(
+    habit_2.completions = list(_generate_daily_completions(
         FIXTURE_START_DATE,
         days=28,
-        skip_days=[3, 10, 18]
-    )
+        skip_days=(3, 10, 18)
+    ))
 
     # 3. Daily habit – missed an entire week
     habit_3 = Habit(
@@ -116,11 +121,11 @@ def load_fixture_habits() -> List[Habit]:
         periodicity="daily",
         created_at=FIXTURE_START_DATE
     )
-    habit_3.completions = _generate_daily_completions(
+    habit_3.completions = list(_generate_daily_completions(
         FIXTURE_START_DATE,
         days=28,
-        skip_days=list(range(14, 21))  # skip week 3 entirely
-    )
+        skip_days=tuple(range(14, 21))  # skip week 3 entirely
+    ))
 
     # 4. Weekly habit – perfect streak (4 weeks)
     habit_4 = Habit(
@@ -128,10 +133,10 @@ def load_fixture_habits() -> List[Habit]:
         periodicity="weekly",
         created_at=FIXTURE_START_DATE
     )
-    habit_4.completions = _generate_weekly_completions(
+    habit_4.completions = list(_generate_weekly_completions(
         FIXTURE_START_DATE,
         weeks=4
-    )
+    ))
 
     # 5. Weekly habit – missed one week
     habit_5 = Habit(
@@ -139,10 +144,10 @@ def load_fixture_habits() -> List[Habit]:
         periodicity="weekly",
         created_at=FIXTURE_START_DATE
     )
-    habit_5.completions = _generate_weekly_completions(
+    habit_5.completions = list(_generate_weekly_completions(
         FIXTURE_START_DATE,
         weeks=4,
-        skip_weeks=[2]
-    )
+        skip_weeks=(2,)
+    ))
 
     return [habit_1, habit_2, habit_3, habit_4, habit_5]
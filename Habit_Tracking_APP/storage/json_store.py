@@ -6,19 +6,33 @@ interface using a JSON file for storage. It is responsible for loading,
 saving, and managing habit data between user sessions.
 
 Storage format:
-- Habits are stored as a list of dictionaries
+- Habits are stored as a list of dictionaries (compact JSON by
+  default, indented when the repository is created with pretty=True)
 - Datetime values are serialized using ISO 8601 strings
+- orjson is used for reading and writing (including the completions
+  log) when installed, otherwise the built-in json module
+- Check-offs recorded since the last full save are appended to a
+  companion JSON Lines log (one completion per line), which is merged
+  on load and folded back into the JSON file on the next full save;
+  logged timestamps already present in the JSON file are ignored
 """
 
 import json
+import os
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from datetime import datetime
 
 from storage.repository import HabitRepository
+from models.completion import Completion
 from models.habit import Habit
 
+try:
+    import orjson
+except ImportError:  # Optional dependency; fall back to the json module
+    orjson = None
+
 
 class JsonHabitRepository(HabitRepository):
     """
@@ -27,14 +41,24 @@ class JsonHabitRepository(HabitRepository):
     This repository persists habit data in a JSON file.
     """
 
-    def __init__(self, file_path: Path):
+    def __init__(self, file_path: Path, pretty: bool = False):
         """
         Initialize the repository.
 
         Args:
             file_path (Path): Path to the JSON file used for storage.
+            pretty (bool): Write indented JSON for human readers instead
+                of compact JSON. Defaults to False (faster, smaller).
         """
         self.file_path = file_path
+        self.pretty = pretty
+        self.completions_path = file_path.with_suffix(".completions.jsonl")
+
+        # Last persisted state per habit ID: (metadata, completions), plus
+        # the identity of the JSON file it was read from or written to.
+        # Used by update() to detect check-offs that can be appended.
+        self._persisted: Dict[str, Tuple[dict, Tuple[datetime, ...]]] = {}
+        self._file_signature: Optional[Tuple[int, int, int]] = None
 
     # ------------------------------------------------------------------
     # Internal helpers
@@ -50,22 +74,127 @@ class JsonHabitRepository(HabitRepository):
         if not self.file_path.exists():
             return []
 
-        with self.file_path.open("r", encoding="utf-8") as file:
-            try:
-                return json.load(file)
-            except json.JSONDecodeError:
-                # Corrupted or empty file → treat as empty storage
-                return []
+        loads = orjson.loads if orjson is not None else json.loads
+
+        try:
+            # One read call for the whole file; both decoders take bytes
+            return loads(self.file_path.read_bytes())
+        except json.JSONDecodeError:
+            # Corrupted or empty file → treat as empty storage
+            # (orjson.JSONDecodeError is a subclass of this error)
+            return []
 
     def _write_file(self, data: List[dict]) -> None:
         """
-        Write raw habit data to the JSON file.
+        Write raw habit data to the JSON file atomically.
 
         Args:
             data (List[dict]): Serializable habit data.
         """
-        with self.file_path.open("w", encoding="utf-8") as file:
-            json.dump(data, file, indent=2)
+        if orjson is not None:
+            option = orjson.OPT_INDENT_2 if self.pretty else 0
+            payload = orjson.dumps(data, option=option)
+        elif self.pretty:
+            payload = json.dumps(data, indent=2).encode("utf-8")
+        else:
+            payload = json.dumps(data, separators=(",", ":")).encode("utf-8")
+
+        # Write to a temporary file and swap it in, so an interrupted
+        # write never leaves a truncated JSON file behind.
+        temp_path = self.file_path.with_suffix(self.file_path.suffix + ".tmp")
+        temp_path.write_bytes(payload)
+        os.replace(temp_path, self.file_path)
+
+    def _read_completions_log(self) -> Dict[str, List[str]]:
+        """
+        Read completions appended since the last full save.
+
+        Returns:
+            Dict[str, List[str]]: ISO 8601 timestamps keyed by habit ID.
+        """
+        if not self.completions_path.exists():
+            return {}
+
+        loads = orjson.loads if orjson is not None else json.loads
+        logged: Dict[str, List[str]] = {}
+
+        with self.completions_path.open("rb") as file:
+            for line in file:
+                if not line.strip():
+                    continue
+                try:
+                    entry = loads(line)
+                except ValueError:
+                    # Torn write from an interrupted append → skip the line
+                    continue
+                logged.setdefault(entry["habit_id"], []).append(
+                    entry["completed_at"]
+                )
+
+        return logged
+
+    def _append_completions(
+        self,
+        habit_id: str,
+        completions: List[datetime]
+    ) -> None:
+        """
+        Append completions to the log without rewriting the JSON file.
+
+        Args:
+            habit_id (str): ID of the completed habit.
+            completions (List[datetime]): New completion timestamps.
+        """
+        if orjson is not None:
+            dumps = orjson.dumps
+        else:
+            def dumps(entry: dict) -> bytes:
+                return json.dumps(entry).encode("utf-8")
+
+        lines = [
+            dumps(Completion(habit_id, dt).to_dict()) + b"\n"
+            for dt in completions
+        ]
+
+        with self.completions_path.open("ab") as file:
+            file.write(b"".join(lines))
+
+    @staticmethod
+    def _metadata(habit: Habit) -> dict:
+        """
+        Return the serialized habit fields other than its completions.
+
+        Built directly rather than via to_dict(), which would serialize
+        every completion only for it to be discarded.
+        """
+        return {
+            "id": habit.id,
+            "name": habit.name,
+            "periodicity": habit.periodicity,
+            "created_at": habit.created_at.isoformat(),
+        }
+
+    def _stat_signature(self) -> Optional[Tuple[int, int, int]]:
+        """
+        Return (inode, mtime, size) of the JSON file, or None if missing.
+
+        Every full save replaces the file, so the signature changes
+        whenever any repository instance rewrites it.
+        """
+        if not self.file_path.exists():
+            return None
+        stat = self.file_path.stat()
+        return stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+    def _remember(self, habits: List[Habit]) -> None:
+        """
+        Record the persisted state of the given habits.
+        """
+        self._persisted = {
+            habit.id: (self._metadata(habit), tuple(habit.completions))
+            for habit in habits
+        }
+        self._file_signature = self._stat_signature()
 
     # ------------------------------------------------------------------
     # Repository interface implementation
@@ -79,18 +208,43 @@ class JsonHabitRepository(HabitRepository):
             List[Habit]: All stored habits.
         """
         raw_data = self._read_file()
-        return [Habit.from_dict(item) for item in raw_data]
+        logged = self._read_completions_log()
+
+        for item in raw_data:
+            extra = logged.get(item["id"])
+            if extra:
+                # A crash between save_all() replacing the JSON file and
+                # removing the log leaves entries that were already
+                # folded in; skip those instead of duplicating them.
+                completions = item.get("completions", [])
+                saved = set(completions)
+                item["completions"] = completions + [
+                    completed_at for completed_at in extra
+                    if completed_at not in saved
+                ]
+
+        habits = [Habit.from_dict(item) for item in raw_data]
+        self._remember(habits)
+        return habits
 
     def save_all(self, habits: List[Habit]) -> None:
         """
         Persist the full list of habits to storage.
 
+        Any logged completions are folded into the JSON file, so the
+        completions log is removed afterwards.
+
         Args:
             habits (List[Habit]): Habits to save.
         """
         data = [habit.to_dict() for habit in habits]
         self._write_file(data)
 
+        if self.completions_path.exists():
+            self.completions_path.unlink()
+
+        self._remember(habits)
+
     def add(self, habit: Habit) -> None:
         """
         Add a new habit to storage.
@@ -141,12 +295,40 @@ class JsonHabitRepository(HabitRepository):
         """
         Update an existing habit in storage.
 
+        If only new completions were added since the habit was last
+        loaded or saved (as done by Habit.check_off()), and the JSON
+        file has not been rewritten since, they are appended to the
+        completions log instead of rewriting the whole file. Any other
+        change takes the full rewrite path.
+
         Args:
             habit (Habit): Habit with updated data.
 
         Raises:
             ValueError: If the habit does not exist.
         """
+        persisted = self._persisted.get(habit.id)
+
+        if (
+            persisted is not None
+            and self._file_signature == self._stat_signature()
+        ):
+            metadata, completions = persisted
+            count = len(completions)
+            if (
+                len(habit.completions) >= count
+                and self._metadata(habit) == metadata
+                and tuple(habit.completions[:count]) == completions
+            ):
+                if len(habit.completions) > count:
+                    self._append_completions(
+                        habit.id, habit.completions[count:]
+                    )
+                    self._persisted[habit.id] = (
+                        metadata, tuple(habit.completions)
+                    )
+                return
+
         habits = self.load_all()
 
         for index, existing in enumerate(habits):
@@ -156,3 +338,20 @@ class JsonHabitRepository(HabitRepository):
                 return
 
         raise ValueError(f"Habit with id '{habit.id}' not found.")
+
+    def is_empty(self) -> bool:
+        """
+        Check whether storage contains no habits without a full load.
+
+        Returns:
+            bool: True if no habits are stored.
+        """
+        if not self.file_path.exists():
+            return True
+
+        # A single serialized habit takes well over 64 bytes, so only
+        # a tiny file (e.g. "[]") has to be parsed to be sure.
+        if self.file_path.stat().st_size > 64:
+            return False
+
+        return not self._read_file()
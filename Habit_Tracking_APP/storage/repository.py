@@ -10,7 +10,7 @@ clean architecture and easy future extensions.
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from models.habit import Habit
 
@@ -92,3 +92,164 @@ class HabitRepository(ABC):
             habit (Habit): Habit with updated data.
         """
         raise NotImplementedError
+
+    @abstractmethod
+    def is_empty(self) -> bool:
+        """
+        Check whether storage contains no habits.
+
+        Implementations should answer this without loading every habit
+        where possible.
+
+        Returns:
+            bool: True if no habits are stored.
+        """
+        raise NotImplementedError
+
+
+class CachingHabitRepository(HabitRepository):
+    """
+    In-memory caching decorator for another HabitRepository.
+
+    The wrapped repository is read once, on first access. Afterwards all
+    reads are served from memory, while every mutation is written
+    through to the wrapped repository so storage never falls behind.
+    An ID → list position index makes get() and update() constant time.
+
+    The cached Habit objects are shared with callers; a habit modified
+    in place must still be passed to update() to be persisted.
+    """
+
+    def __init__(self, repository: HabitRepository):
+        """
+        Initialize the caching repository.
+
+        Args:
+            repository (HabitRepository): Repository to read from and
+                write through to.
+        """
+        self._repository = repository
+        self._cache: Optional[List[Habit]] = None
+        self._by_id: Dict[str, int] = {}
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+
+    def _habits(self) -> List[Habit]:
+        """
+        Return the cached habit list, loading it on first access.
+
+        Returns:
+            List[Habit]: The cached habits (not a copy).
+        """
+        if self._cache is None:
+            self._set_cache(self._repository.load_all())
+        return self._cache
+
+    def _set_cache(self, habits: List[Habit]) -> None:
+        """
+        Replace the cached habit list and rebuild the ID index.
+
+        Args:
+            habits (List[Habit]): Habits to cache.
+        """
+        self._cache = list(habits)
+        self._by_id = {habit.id: index for index, habit in enumerate(habits)}
+
+    # ------------------------------------------------------------------
+    # Repository interface implementation
+    # ------------------------------------------------------------------
+
+    def load_all(self) -> List[Habit]:
+        """
+        Return all habits from the cache.
+
+        Returns:
+            List[Habit]: A new list containing all cached habits.
+        """
+        return list(self._habits())
+
+    def save_all(self, habits: List[Habit]) -> None:
+        """
+        Persist the full list of habits and replace the cache.
+
+        Args:
+            habits (List[Habit]): Habits to save.
+        """
+        self._repository.save_all(habits)
+        self._set_cache(habits)
+
+    def add(self, habit: Habit) -> None:
+        """
+        Add a new habit to storage and to the cache.
+
+        Args:
+            habit (Habit): Habit to add.
+        """
+        self.save_all(self._habits() + [habit])
+
+    def delete(self, habit_id: str) -> bool:
+        """
+        Delete a habit by its ID.
+
+        Args:
+            habit_id (str): ID of the habit to delete.
+
+        Returns:
+            bool: True if the habit was deleted, False otherwise.
+        """
+        habits = self._habits()
+
+        if habit_id not in self._by_id:
+            return False
+
+        self.save_all([h for h in habits if h.id != habit_id])
+        return True
+
+    def get(self, habit_id: str) -> Optional[Habit]:
+        """
+        Retrieve a habit by its ID from the cache.
+
+        Args:
+            habit_id (str): ID of the habit.
+
+        Returns:
+            Habit or None: The habit if found, otherwise None.
+        """
+        habits = self._habits()
+        index = self._by_id.get(habit_id)
+        return None if index is None else habits[index]
+
+    def update(self, habit: Habit) -> None:
+        """
+        Update an existing habit in storage and in the cache.
+
+        Args:
+            habit (Habit): Habit with updated data.
+
+        Raises:
+            ValueError: If the habit does not exist.
+        """
+        habits = self._habits()
+        index = self._by_id.get(habit.id)
+
+        if index is None:
+            raise ValueError(f"Habit with id '{habit.id}' not found.")
+
+        self._repository.update(habit)
+        habits[index] = habit
+
+    def is_empty(self) -> bool:
+        """
+        Check whether storage contains no habits.
+
+        Uses the cache if it is loaded, otherwise asks the wrapped
+        repository without loading all habits.
+
+        Returns:
+            bool: True if no habits are stored.
+        """
+        if self._cache is None:
+            return self._repository.is_empty()
+        return not self._cache
@@ -4,30 +4,76 @@ Pytest configuration and shared fixtures.
 This module provides reusable pytest fixtures for:
 - Predefined habit data (5 habits with 4 weeks of completions)
 - Temporary JSON storage paths for isolated persistence tests
+- Cached repositories wrapping temporary JSON storage
+
+Setting the FAST_TESTS environment variable skips pytest's cache
+writes (last-failed / new-first bookkeeping) for quicker runs, unless
+--lf, --ff or --nf is given.
 """
 
+import copy
+import os
 import pytest
 from pathlib import Path
 
 from seed.fixtures import load_fixture_habits
 from storage.json_store import JsonHabitRepository
+from storage.repository import CachingHabitRepository
+
+
+# ------------------------------------------------------------------
+# Pytest configuration
+# ------------------------------------------------------------------
+
+@pytest.hookimpl(trylast=True)
+def pytest_configure(config):
+    """
+    Drop the cache-writing plugins when FAST_TESTS is set.
+
+    They are kept if --lf, --ff or --nf was requested, since those
+    options rely on them and would otherwise be silently ignored.
+    """
+    if not os.environ.get("FAST_TESTS"):
+        return
+
+    if not any(
+        config.getoption(option, default=False)
+        for option in ("lf", "failedfirst", "newfirst")
+    ):
+        for name in ("lfplugin", "nfplugin"):
+            if config.pluginmanager.has_plugin(name):
+                config.pluginmanager.unregister(name=name)
 
 
 # ------------------------------------------------------------------
 # Fixture: predefined habits (domain-level)
 # ------------------------------------------------------------------
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def fixture_habits():
     """
     Load predefined habits with deterministic 4-week completion data.
 
+    Built once per test session and shared; tests must not modify the
+    habits (use fixture_habits_mut instead).
+
     Returns:
         list[Habit]: List of 5 predefined Habit objects.
     """
     return load_fixture_habits()
 
 
+@pytest.fixture
+def fixture_habits_mut(fixture_habits):
+    """
+    Provide a private deep copy of the predefined habits.
+
+    Returns:
+        list[Habit]: Copy of the 5 predefined Habit objects.
+    """
+    return copy.deepcopy(fixture_habits)
+
+
 # ------------------------------------------------------------------
 # Fixture: temporary JSON storage path
 # ------------------------------------------------------------------
@@ -61,3 +107,18 @@ def temp_repository(temp_json_path: Path):
         JsonHabitRepository: Repository using temporary storage.
     """
     return JsonHabitRepository(temp_json_path)
+
+
+# ------------------------------------------------------------------
+# Fixture: caching repository wrapping the temporary JSON repository
+# ------------------------------------------------------------------
+
+@pytest.fixture
+def cached_repository(temp_repository):
+    """
+    Provide a CachingHabitRepository wrapping the temporary repository.
+
+    Returns:
+        CachingHabitRepository: Cached repository using temporary storage.
+    """
+    return CachingHabitRepository(temp_repository)
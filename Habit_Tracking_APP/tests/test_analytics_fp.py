@@ -5,18 +5,24 @@ These tests verify:
 - Listing all habits
 - Filtering habits by periodicity
 - Longest streak calculation for a single habit
+- Longest streaks for all habits at once
 - Longest streak calculation across all habits
 
 All tests use deterministic fixture data to allow
 exact streak value assertions.
 """
 
+import pytest
+from datetime import datetime
+
 from analytics.analytics import (
     list_all_habits,
     list_habits_by_periodicity,
     longest_streak_for_habit,
     longest_streak_all,
+    longest_streak_per_habit,
 )
+from models.habit import Habit
 
 
 # ------------------------------------------------------------------
@@ -57,54 +63,102 @@ def test_list_habits_by_periodicity_weekly(fixture_habits):
 # Streak calculations (single habit)
 # ------------------------------------------------------------------
 
-def test_longest_streak_for_daily_perfect_habit(fixture_habits):
+@pytest.fixture(scope="module")
+def fixture_streaks(fixture_habits):
     """
-    Daily habit with perfect 4-week streak should return 28.
+    Longest streaks of all predefined habits, computed once per module.
+
+    Returns:
+        dict[str, int]: Longest streak keyed by habit ID.
     """
-    habit = fixture_habits[0]  # Drink Water (perfect daily)
-    streak = longest_streak_for_habit(habit)
+    return longest_streak_per_habit(fixture_habits)
 
-    assert streak == 28
+
+@pytest.mark.parametrize(
+    "idx, expected",
+    [
+        (0, 28),  # Drink Water (perfect daily)
+        (1, 9),   # Morning Walk (missed days)
+        (2, 14),  # Read 20 Pages (missed week)
+        (3, 4),   # Go to the Gym (perfect weekly)
+        (4, 2),   # Weekly Planning (missed week)
+    ],
+)
+def test_longest_streak(fixture_habits, fixture_streaks, idx, expected):
+    """
+    Each predefined habit should have its known longest streak.
+    """
+    streak = fixture_streaks[fixture_habits[idx].id]
+
+    assert streak == expected
 
 
-def test_longest_streak_for_daily_with_missed_days(fixture_habits):
+def test_longest_streak_weekly_ignores_time_of_day():
     """
-    Daily habit with missed days should return correct longest streak.
+    A completion early on Monday should still count for its week,
+    even if the first completion happened later in the day.
     """
-    habit = fixture_habits[1]  # Morning Walk (missed days)
-    streak = longest_streak_for_habit(habit)
+    habit = Habit(
+        name="Late Then Early",
+        periodicity="weekly",
+        completions=[datetime(2024, 1, 3, 21, 0), datetime(2024, 1, 8, 2, 0)],
+    )
 
-    assert streak == 9
+    assert longest_streak_for_habit(habit) == 2
 
 
-def test_longest_streak_for_daily_with_missed_week(fixture_habits):
+def test_longest_streak_weekly_across_iso_year_boundary():
     """
-    Daily habit with one full missed week should return correct streak.
+    Weekly streaks should continue through ISO week 53 into the next year.
     """
-    habit = fixture_habits[2]  # Read 20 Pages (missed week)
-    streak = longest_streak_for_habit(habit)
+    habit = Habit(
+        name="Year End",
+        periodicity="weekly",
+        completions=[
+            datetime(2020, 12, 21, 9, 0),  # 2020-W52
+            datetime(2021, 1, 3, 9, 0),    # 2020-W53 (Sunday)
+            datetime(2021, 1, 4, 9, 0),    # 2021-W01
+        ],
+    )
 
-    assert streak == 14
+    assert longest_streak_for_habit(habit) == 3
 
 
-def test_longest_streak_for_weekly_perfect(fixture_habits):
+def test_longest_streak_for_sparse_unsorted_habit():
     """
-    Weekly habit with perfect 4-week streak should return 4.
+    Sparse completions far apart and out of order should only count
+    the consecutive periods that were actually completed.
     """
-    habit = fixture_habits[3]  # Go to the Gym
-    streak = longest_streak_for_habit(habit)
+    habit = Habit(
+        name="Sparse Habit",
+        periodicity="daily",
+        completions=[
+            datetime(2024, 12, 31, 8, 0),
+            datetime(2023, 1, 1, 8, 0),
+            datetime(2024, 12, 30, 8, 0),
+            datetime(2023, 1, 1, 20, 0),
+            datetime(2024, 6, 1, 8, 0),
+        ],
+    )
 
-    assert streak == 4
+    assert longest_streak_for_habit(habit) == 2
 
 
-def test_longest_streak_for_weekly_with_missed_week(fixture_habits):
+def test_longest_streak_reflects_in_place_edit():
     """
-    Weekly habit with one missed week should return correct streak.
+    Replacing a completion after a streak was calculated should be
+    picked up by the next calculation.
     """
-    habit = fixture_habits[4]  # Weekly Planning
-    streak = longest_streak_for_habit(habit)
+    habit = Habit(
+        name="Edited Habit",
+        periodicity="daily",
+        completions=[datetime(2024, 1, 1), datetime(2024, 1, 2)],
+    )
+    assert longest_streak_for_habit(habit) == 2
 
-    assert streak == 2
+    habit.completions[1] = datetime(2024, 3, 1)
+
+    assert longest_streak_for_habit(habit) == 1
 
 
 # ------------------------------------------------------------------
@@ -124,3 +178,29 @@ def test_longest_streak_all(fixture_habits):
 
     assert habit_name == "Drink Water"
     assert streak == 28
+
+
+def test_longest_streak_all_prefers_first_habit_on_tie():
+    """
+    When streaks tie, longest_streak_all() should return the habit
+    listed first, even if a later habit has more completions.
+    """
+    first = Habit(
+        name="First",
+        periodicity="daily",
+        completions=[datetime(2024, 1, 1), datetime(2024, 1, 2)],
+    )
+    second = Habit(
+        name="Second",
+        periodicity="daily",
+        completions=[
+            datetime(2024, 1, 1),
+            datetime(2024, 1, 2),
+            datetime(2024, 1, 5),
+            datetime(2024, 1, 9),
+        ],
+    )
+
+    result = longest_streak_all([first, second])
+
+    assert result == (first.id, "First", 2)
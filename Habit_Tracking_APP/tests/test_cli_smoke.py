@@ -4,6 +4,9 @@ Smoke tests for the CLI module.
 These tests ensure that the CLI module and its main
 entry functions can be imported without errors.
 No interactive input is tested here.
+
+PYTEST_DONT_REWRITE: this module only checks imports, so pytest's
+assertion rewriting (and its .pyc output) is skipped for it.
 """
 
 def test_cli_module_imports():
@@ -0,0 +1,154 @@
+"""
+Unit tests for the date and period helpers.
+
+These tests verify:
+- Period key formatting for daily and weekly periodicities
+- Generation of all expected period keys between two dates
+- Integer period indices used by the streak calculation
+"""
+
+import pytest
+from datetime import datetime
+
+from utils.dates import (
+    generate_period_keys,
+    get_period_index,
+    get_period_key,
+)
+
+
+# ------------------------------------------------------------------
+# Period keys
+# ------------------------------------------------------------------
+
+@pytest.mark.parametrize(
+    "dt, periodicity, expected",
+    [
+        (datetime(2024, 1, 5, 9, 30), "daily", "2024-01-05"),
+        (datetime(2024, 1, 5, 9, 30), "weekly", "2024-01"),
+        (datetime(2021, 1, 3, 23, 59), "weekly", "2020-53"),
+        (datetime(2024, 12, 30, 0, 0), "weekly", "2025-01"),
+    ],
+)
+def test_get_period_key(dt, periodicity, expected):
+    """
+    get_period_key() should return YYYY-MM-DD or ISO YYYY-WW keys.
+    """
+    assert get_period_key(dt, periodicity) == expected
+
+
+def test_get_period_key_rejects_invalid_periodicity():
+    """
+    get_period_key() should reject unknown periodicities.
+    """
+    with pytest.raises(ValueError):
+        get_period_key(datetime(2024, 1, 1), "monthly")
+
+
+# ------------------------------------------------------------------
+# Period key generation
+# ------------------------------------------------------------------
+
+def test_generate_daily_period_keys():
+    """
+    Daily keys should cover every day between start and end inclusive.
+    """
+    keys = generate_period_keys(
+        datetime(2024, 2, 27, 9, 0), datetime(2024, 3, 1, 8, 0), "daily"
+    )
+
+    assert keys == ["2024-02-27", "2024-02-28", "2024-02-29", "2024-03-01"]
+
+
+def test_generate_weekly_period_keys():
+    """
+    Weekly keys should cover every ISO week between start and end.
+    """
+    keys = generate_period_keys(
+        datetime(2024, 1, 3), datetime(2024, 1, 22), "weekly"
+    )
+
+    assert keys == ["2024-01", "2024-02", "2024-03", "2024-04"]
+
+
+def test_generate_weekly_period_keys_ignores_time_of_day():
+    """
+    The final week should be included even when the end datetime is
+    earlier in the day than the start datetime.
+    """
+    keys = generate_period_keys(
+        datetime(2024, 1, 1, 21, 0), datetime(2024, 1, 8, 2, 0), "weekly"
+    )
+
+    assert keys == ["2024-01", "2024-02"]
+
+
+@pytest.mark.parametrize(
+    "start, end, expected",
+    [
+        # 2020 has 53 ISO weeks
+        (
+            datetime(2020, 12, 21),
+            datetime(2021, 1, 11),
+            ["2020-52", "2020-53", "2021-01", "2021-02"],
+        ),
+        # 2021 has 52 ISO weeks
+        (
+            datetime(2021, 12, 20),
+            datetime(2022, 1, 10),
+            ["2021-51", "2021-52", "2022-01", "2022-02"],
+        ),
+    ],
+)
+def test_generate_weekly_period_keys_across_iso_year_end(start, end, expected):
+    """
+    Weekly keys should roll over correctly after week 52 or week 53.
+    """
+    assert generate_period_keys(start, end, "weekly") == expected
+
+
+def test_generate_period_keys_swaps_reversed_range():
+    """
+    A start after the end should be treated as the reversed range.
+    """
+    keys = generate_period_keys(
+        datetime(2024, 1, 2), datetime(2024, 1, 1), "daily"
+    )
+
+    assert keys == ["2024-01-01", "2024-01-02"]
+
+
+def test_generate_period_keys_rejects_invalid_periodicity():
+    """
+    generate_period_keys() should reject unknown periodicities.
+    """
+    with pytest.raises(ValueError):
+        generate_period_keys(
+            datetime(2024, 1, 1), datetime(2024, 1, 2), "monthly"
+        )
+
+
+# ------------------------------------------------------------------
+# Period indices
+# ------------------------------------------------------------------
+
+def test_get_period_index_weekly_starts_on_monday():
+    """
+    Weekly indices should change between Sunday and Monday only.
+    """
+    sunday = get_period_index(datetime(2024, 1, 7, 23, 0), "weekly")
+    monday = get_period_index(datetime(2024, 1, 8, 0, 0), "weekly")
+    prior_monday = get_period_index(datetime(2024, 1, 1, 0, 0), "weekly")
+
+    assert monday == sunday + 1
+    assert sunday == prior_monday
+
+
+def test_get_period_index_daily_is_consecutive():
+    """
+    Daily indices of consecutive days should differ by one.
+    """
+    first = get_period_index(datetime(2024, 2, 28, 23, 0), "daily")
+    second = get_period_index(datetime(2024, 2, 29, 1, 0), "daily")
+
+    assert second == first + 1
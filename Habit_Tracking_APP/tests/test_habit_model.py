@@ -6,6 +6,7 @@ These tests validate:
 - Habit check-off behavior
 - JSON serialization round-trip integrity
 - Allowing multiple check-offs in the same period
+- Cached period indices used by analytics
 """
 
 import pytest
@@ -66,6 +67,77 @@ def test_multiple_check_offs_in_same_period_allowed():
     assert len(habit.completions) == 2
 
 
+def test_get_completion_timestamps_returns_completions():
+    """
+    get_completion_timestamps() should return the recorded timestamps.
+    """
+    habit = Habit(name="Timestamps", periodicity="daily")
+    habit.check_off(datetime(2024, 1, 1, 9, 0))
+    habit.check_off(datetime(2024, 1, 2, 9, 0))
+
+    assert habit.get_completion_timestamps() == [
+        datetime(2024, 1, 1, 9, 0),
+        datetime(2024, 1, 2, 9, 0),
+    ]
+
+
+# ------------------------------------------------------------------
+# Period index cache
+# ------------------------------------------------------------------
+
+def test_period_indices_follow_check_offs():
+    """
+    get_period_indices() should include periods checked off after
+    a previous call.
+    """
+    habit = Habit(name="Indexed Habit", periodicity="daily")
+    habit.check_off(datetime(2024, 1, 1, 9, 0))
+
+    assert len(habit.get_period_indices()) == 1
+
+    habit.check_off(datetime(2024, 1, 1, 18, 0))
+    habit.check_off(datetime(2024, 1, 2, 9, 0))
+
+    assert len(habit.get_period_indices()) == 2
+
+
+def test_period_indices_rebuilt_when_completions_replaced():
+    """
+    Replacing the completions list should invalidate the cache.
+    """
+    habit = Habit(name="Replaced Habit", periodicity="weekly")
+    habit.check_off(datetime(2024, 1, 1, 9, 0))
+    before = set(habit.get_period_indices())
+
+    habit.completions = [datetime(2024, 2, 1, 9, 0)]
+
+    assert habit.get_period_indices() != before
+    assert len(habit.get_period_indices()) == 1
+
+
+def test_period_indices_rebuilt_after_in_place_edit():
+    """
+    Editing or swapping a completion without changing the list length
+    should invalidate the cache.
+    """
+    habit = Habit(
+        name="Edited Habit",
+        periodicity="daily",
+        completions=[datetime(2024, 1, 1), datetime(2024, 1, 2)],
+    )
+    assert len(habit.get_period_indices()) == 2
+
+    habit.completions[1] = datetime(2024, 1, 1, 18, 0)
+    assert len(habit.get_period_indices()) == 1
+
+    habit.completions.pop()
+    habit.completions.append(datetime(2024, 3, 1))
+    indices = habit.get_period_indices()
+
+    assert len(indices) == 2
+    assert max(indices) - min(indices) > 1
+
+
 # ------------------------------------------------------------------
 # Serialization tests
 # ------------------------------------------------------------------
@@ -0,0 +1,108 @@
+"""
+Unit tests for the caching habit repository.
+
+These tests verify:
+- Reads are served from memory after the first load
+- Mutations are written through to the wrapped repository
+- CRUD semantics match the wrapped repository
+"""
+
+import pytest
+from datetime import datetime
+
+from models.habit import Habit
+from storage.json_store import JsonHabitRepository
+
+
+# ------------------------------------------------------------------
+# Caching behavior
+# ------------------------------------------------------------------
+
+def test_load_all_is_served_from_cache(cached_repository, temp_json_path,
+                                       fixture_habits):
+    """
+    After the first load, load_all() should not touch the file again.
+    """
+    JsonHabitRepository(temp_json_path).save_all(fixture_habits)
+
+    first = cached_repository.load_all()
+    temp_json_path.unlink()
+    second = cached_repository.load_all()
+
+    assert [h.id for h in second] == [h.id for h in first]
+    assert len(second) == len(fixture_habits)
+
+
+def test_load_all_returns_a_new_list(cached_repository):
+    """
+    Mutating the returned list should not affect the cache.
+    """
+    cached_repository.load_all().append(
+        Habit(name="Not Saved", periodicity="daily")
+    )
+
+    assert cached_repository.load_all() == []
+
+
+# ------------------------------------------------------------------
+# Write-through behavior
+# ------------------------------------------------------------------
+
+def test_add_writes_through(cached_repository, temp_json_path):
+    """
+    add() should persist the habit to the wrapped repository.
+    """
+    habit = Habit(name="Cached Habit", periodicity="daily")
+
+    cached_repository.add(habit)
+    stored = JsonHabitRepository(temp_json_path).load_all()
+
+    assert [h.id for h in stored] == [habit.id]
+    assert cached_repository.get(habit.id) is habit
+
+
+def test_update_writes_through(cached_repository, temp_json_path):
+    """
+    update() should persist changes to the wrapped repository.
+    """
+    habit = Habit(name="Cached Update", periodicity="weekly")
+    cached_repository.add(habit)
+
+    habit.check_off(datetime(2024, 1, 1, 9, 0))
+    cached_repository.update(habit)
+    stored = JsonHabitRepository(temp_json_path).get(habit.id)
+
+    assert stored is not None
+    assert stored.completions == [datetime(2024, 1, 1, 9, 0)]
+
+
+def test_update_unknown_habit_raises(cached_repository):
+    """
+    update() should raise ValueError for a habit that is not stored.
+    """
+    with pytest.raises(ValueError):
+        cached_repository.update(Habit(name="Unknown", periodicity="daily"))
+
+
+def test_delete_writes_through(cached_repository, temp_json_path):
+    """
+    delete() should remove the habit from the cache and from storage.
+    """
+    habit = Habit(name="Cached Delete", periodicity="daily")
+    cached_repository.add(habit)
+
+    assert cached_repository.delete(habit.id) is True
+    assert cached_repository.delete(habit.id) is False
+    assert cached_repository.load_all() == []
+    assert JsonHabitRepository(temp_json_path).load_all() == []
+
+
+def test_is_empty_does_not_load_cache(cached_repository, temp_json_path,
+                                      fixture_habits):
+    """
+    is_empty() should answer from storage until the cache is loaded.
+    """
+    JsonHabitRepository(temp_json_path).save_all(fixture_habits)
+
+    assert cached_repository.is_empty() is False
+    assert cached_repository._cache is None
@@ -4,9 +4,12 @@ Unit tests for the JSON-based habit repository.
 These tests verify:
 - Save/load round-trip persistence
 - Add, get, update, and delete operations
+- Appending check-offs to the completions log
 - Robust behavior when the JSON file does not exist
 """
 
+import json
+import pytest
 from datetime import datetime
 
 from models.habit import Habit
@@ -17,29 +20,25 @@ from storage.json_store import JsonHabitRepository
 # Load / save behavior
 # ------------------------------------------------------------------
 
-def test_load_returns_empty_list_when_file_missing(temp_json_path):
+def test_load_returns_empty_list_when_file_missing(temp_repository):
     """
     Repository should return an empty list if the JSON file does not exist.
     """
-    repo = JsonHabitRepository(temp_json_path)
-
-    habits = repo.load_all()
+    habits = temp_repository.load_all()
 
     assert habits == []
 
 
-def test_save_and_load_round_trip(temp_json_path, fixture_habits):
+def test_save_and_load_round_trip(temp_repository, fixture_habits_mut):
     """
     Saving habits and loading them back should preserve all data.
     """
-    repo = JsonHabitRepository(temp_json_path)
-
-    repo.save_all(fixture_habits)
-    loaded = repo.load_all()
+    temp_repository.save_all(fixture_habits_mut)
+    loaded = temp_repository.load_all()
 
-    assert len(loaded) == len(fixture_habits)
+    assert len(loaded) == len(fixture_habits_mut)
 
-    for original, restored in zip(fixture_habits, loaded):
+    for original, restored in zip(fixture_habits_mut, loaded):
         assert original.id == restored.id
         assert original.name == restored.name
         assert original.periodicity == restored.periodicity
@@ -47,77 +46,220 @@ def test_save_and_load_round_trip(temp_json_path, fixture_habits):
         assert original.completions == restored.completions
 
 
+def test_save_leaves_no_temporary_file(temp_repository, fixture_habits):
+    """
+    save_all() should replace the JSON file without leaving its
+    temporary file behind.
+    """
+    temp_repository.save_all(fixture_habits)
+
+    assert [p.name for p in temp_repository.file_path.parent.iterdir()] == [
+        temp_repository.file_path.name
+    ]
+
+
+def test_save_writes_compact_json_unless_pretty(temp_json_path):
+    """
+    save_all() should write compact JSON by default and indented JSON
+    when the repository is created with pretty=True.
+    """
+    habits = [Habit(name="Format Habit", periodicity="daily")]
+
+    JsonHabitRepository(temp_json_path).save_all(habits)
+    compact = temp_json_path.read_text(encoding="utf-8")
+
+    JsonHabitRepository(temp_json_path, pretty=True).save_all(habits)
+    pretty = temp_json_path.read_text(encoding="utf-8")
+
+    assert "\n" not in compact
+    assert "\n  " in pretty
+    assert json.loads(compact) == json.loads(pretty)
+
+
 # ------------------------------------------------------------------
 # CRUD operations
 # ------------------------------------------------------------------
 
-def test_add_habit(temp_json_path):
+def test_add_habit(temp_repository):
     """
     add() should persist a new habit.
     """
-    repo = JsonHabitRepository(temp_json_path)
     habit = Habit(name="Test Habit", periodicity="daily")
 
-    repo.add(habit)
-    habits = repo.load_all()
+    temp_repository.add(habit)
+    habits = temp_repository.load_all()
 
     assert len(habits) == 1
     assert habits[0].id == habit.id
 
 
-def test_get_habit_by_id(temp_json_path):
+def test_get_habit_by_id(temp_repository):
     """
     get() should return the correct habit by ID.
     """
-    repo = JsonHabitRepository(temp_json_path)
     habit = Habit(name="Get Habit", periodicity="weekly")
 
-    repo.add(habit)
-    fetched = repo.get(habit.id)
+    temp_repository.add(habit)
+    fetched = temp_repository.get(habit.id)
 
     assert fetched is not None
     assert fetched.id == habit.id
     assert fetched.name == habit.name
 
 
-def test_update_habit(temp_json_path):
+def test_update_habit(temp_repository):
     """
     update() should persist changes to an existing habit.
     """
-    repo = JsonHabitRepository(temp_json_path)
     habit = Habit(name="Update Habit", periodicity="daily")
 
-    repo.add(habit)
+    temp_repository.add(habit)
 
     habit.check_off(datetime(2024, 1, 1, 9, 0))
-    repo.update(habit)
+    temp_repository.update(habit)
 
-    updated = repo.get(habit.id)
+    updated = temp_repository.get(habit.id)
 
     assert updated is not None
     assert len(updated.completions) == 1
 
 
-def test_delete_habit(temp_json_path):
+def test_delete_habit(temp_repository):
     """
     delete() should remove a habit from storage.
     """
-    repo = JsonHabitRepository(temp_json_path)
     habit = Habit(name="Delete Habit", periodicity="daily")
 
-    repo.add(habit)
-    deleted = repo.delete(habit.id)
+    temp_repository.add(habit)
+    deleted = temp_repository.delete(habit.id)
 
     assert deleted is True
-    assert repo.load_all() == []
+    assert temp_repository.load_all() == []
 
 
-def test_delete_nonexistent_habit_returns_false(temp_json_path):
+def test_delete_nonexistent_habit_returns_false(temp_repository):
     """
     delete() should return False if the habit does not exist.
     """
-    repo = JsonHabitRepository(temp_json_path)
-
-    result = repo.delete("non-existent-id")
+    result = temp_repository.delete("non-existent-id")
 
     assert result is False
+
+
+# ------------------------------------------------------------------
+# Completions log
+# ------------------------------------------------------------------
+
+def test_update_with_new_completion_appends_to_log(temp_repository):
+    """
+    update() after a check-off should append to the completions log
+    and leave the JSON file untouched.
+    """
+    habit = Habit(name="Log Habit", periodicity="daily")
+
+    temp_repository.add(habit)
+    before = temp_repository.file_path.read_text(encoding="utf-8")
+
+    habit.check_off(datetime(2024, 1, 1, 9, 0))
+    temp_repository.update(habit)
+
+    assert temp_repository.file_path.read_text(encoding="utf-8") == before
+    assert temp_repository.completions_path.exists()
+
+    reloaded = JsonHabitRepository(temp_repository.file_path).get(habit.id)
+
+    assert reloaded is not None
+    assert reloaded.completions == [datetime(2024, 1, 1, 9, 0)]
+
+
+def test_update_after_in_place_edit_rewrites_file(temp_repository):
+    """
+    update() should persist an edited completion, not just appended ones.
+    """
+    habit = Habit(name="Edited Habit", periodicity="daily")
+
+    temp_repository.add(habit)
+    habit.check_off(datetime(2024, 1, 1, 9, 0))
+    temp_repository.update(habit)
+
+    habit.completions[0] = datetime(2024, 1, 2, 9, 0)
+    temp_repository.update(habit)
+
+    reloaded = JsonHabitRepository(temp_repository.file_path).get(habit.id)
+
+    assert reloaded is not None
+    assert reloaded.completions == [datetime(2024, 1, 2, 9, 0)]
+
+
+def test_update_after_delete_elsewhere_raises(temp_repository):
+    """
+    update() should raise if another repository deleted the habit.
+    """
+    habit = Habit(name="Deleted Elsewhere", periodicity="daily")
+
+    temp_repository.add(habit)
+    JsonHabitRepository(temp_repository.file_path).delete(habit.id)
+
+    habit.check_off(datetime(2024, 1, 1, 9, 0))
+
+    with pytest.raises(ValueError):
+        temp_repository.update(habit)
+
+    assert not temp_repository.completions_path.exists()
+
+
+def test_save_all_compacts_completions_log(temp_repository):
+    """
+    save_all() should fold logged completions into the JSON file.
+    """
+    habit = Habit(name="Compact Habit", periodicity="weekly")
+
+    temp_repository.add(habit)
+    habit.check_off(datetime(2024, 1, 1, 9, 0))
+    temp_repository.update(habit)
+
+    temp_repository.save_all(temp_repository.load_all())
+
+    assert not temp_repository.completions_path.exists()
+    assert temp_repository.get(habit.id).completions == [
+        datetime(2024, 1, 1, 9, 0)
+    ]
+
+
+def test_stale_completions_log_is_not_merged_twice(temp_repository):
+    """
+    A log left behind by a save_all() interrupted after replacing the
+    JSON file should not duplicate completions on load.
+    """
+    habit = Habit(name="Interrupted Habit", periodicity="daily")
+
+    temp_repository.add(habit)
+    habit.check_off(datetime(2024, 1, 1, 9, 0))
+    temp_repository.update(habit)
+    stale_log = temp_repository.completions_path.read_bytes()
+
+    temp_repository.save_all(temp_repository.load_all())
+    temp_repository.completions_path.write_bytes(stale_log)
+
+    assert temp_repository.get(habit.id).completions == [
+        datetime(2024, 1, 1, 9, 0)
+    ]
+
+
+# ------------------------------------------------------------------
+# Emptiness check
+# ------------------------------------------------------------------
+
+def test_is_empty_tracks_stored_habits(temp_repository):
+    """
+    is_empty() should reflect whether any habit is stored.
+    """
+    habit = Habit(name="Empty Check", periodicity="daily")
+
+    assert temp_repository.is_empty() is True
+
+    temp_repository.add(habit)
+    assert temp_repository.is_empty() is False
+
+    temp_repository.delete(habit.id)
+    assert temp_repository.is_empty() is True
@@ -0,0 +1,106 @@
+"""
+Unit tests for the validation helpers.
+
+These tests verify:
+- Periodicity normalization and rejection of invalid values
+- Habit name cleaning and rejection of empty names
+- Datetime input parsing
+"""
+
+import pytest
+from datetime import datetime
+
+from utils.validators import (
+    parse_datetime_input,
+    validate_habit_name,
+    validate_periodicity,
+)
+
+
+# ------------------------------------------------------------------
+# Periodicity
+# ------------------------------------------------------------------
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("daily", "daily"),
+        ("weekly", "weekly"),
+        ("  Daily ", "daily"),
+        ("WEEKLY", "weekly"),
+    ],
+)
+def test_validate_periodicity_normalizes(value, expected):
+    """
+    validate_periodicity() should return the canonical periodicity.
+    """
+    assert validate_periodicity(value) == expected
+
+
+@pytest.mark.parametrize("value", ["monthly", "", None, 7])
+def test_validate_periodicity_rejects_invalid(value):
+    """
+    validate_periodicity() should reject unknown or non-string values.
+    """
+    with pytest.raises(ValueError):
+        validate_periodicity(value)
+
+
+# ------------------------------------------------------------------
+# Habit name
+# ------------------------------------------------------------------
+
+def test_validate_habit_name_strips_whitespace():
+    """
+    validate_habit_name() should return the stripped name.
+    """
+    assert validate_habit_name("  Read  ") == "Read"
+
+
+@pytest.mark.parametrize("value", ["", "   ", None])
+def test_validate_habit_name_rejects_empty(value):
+    """
+    validate_habit_name() should reject empty or non-string names.
+    """
+    with pytest.raises(ValueError):
+        validate_habit_name(value)
+
+
+# ------------------------------------------------------------------
+# Datetime input
+# ------------------------------------------------------------------
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("2024-01-05 09:30", datetime(2024, 1, 5, 9, 30)),
+        (" 2024-1-5 9:05 ", datetime(2024, 1, 5, 9, 5)),
+        ("2024-01-05   09:30", datetime(2024, 1, 5, 9, 30)),
+    ],
+)
+def test_parse_datetime_input_default_format(value, expected):
+    """
+    parse_datetime_input() should accept what strptime accepts
+    for the default format.
+    """
+    assert parse_datetime_input(value) == expected
+
+
+@pytest.mark.parametrize(
+    "value", ["2024-13-05 09:30", "2024-01-05 24:00", "2024-01-05", "soon"]
+)
+def test_parse_datetime_input_rejects_invalid(value):
+    """
+    parse_datetime_input() should reject malformed or impossible values.
+    """
+    with pytest.raises(ValueError):
+        parse_datetime_input(value)
+
+
+def test_parse_datetime_input_custom_format():
+    """
+    parse_datetime_input() should honour a custom format.
+    """
+    result = parse_datetime_input("05.01.2024", format="%d.%m.%Y")
+
+    assert result == datetime(2024, 1, 5)
@@ -7,10 +7,20 @@ This module provides pure helper functions to work with time periods
 No state is stored and no I/O is performed here.
 """
 
-from datetime import datetime, timedelta
+from datetime import date, datetime
 from typing import List
 
 
+def _format_day(dt: date) -> str:
+    """
+    Format a date as YYYY-MM-DD.
+
+    Equivalent to dt.strftime("%Y-%m-%d") but avoids interpreting the
+    format string on every call.
+    """
+    return f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d}"
+
+
 def get_period_key(dt: datetime, periodicity: str) -> str:
     """
     Compute a period key for a given datetime and periodicity.
@@ -32,7 +42,7 @@ def get_period_key(dt: datetime, periodicity: str) -> str:
         ValueError: If periodicity is invalid.
     """
     if periodicity == "daily":
-        return dt.strftime("%Y-%m-%d")
+        return _format_day(dt)
 
     if periodicity == "weekly":
         iso_year, iso_week, _ = dt.isocalendar()
@@ -41,6 +51,34 @@ def get_period_key(dt: datetime, periodicity: str) -> str:
     raise ValueError("Periodicity must be 'daily' or 'weekly'.")
 
 
+def get_period_index(dt: datetime, periodicity: str) -> int:
+    """
+    Compute an integer index of the period containing a datetime.
+
+    Daily periods are numbered by date ordinal. Weekly periods are
+    numbered by Monday-based weeks since 0001-01-01 (itself a Monday),
+    which matches ISO week boundaries. Consecutive periods therefore
+    always differ by exactly one.
+
+    Args:
+        dt (datetime): The datetime to compute the period index for.
+        periodicity (str): Either "daily" or "weekly".
+
+    Returns:
+        int: Period index.
+
+    Raises:
+        ValueError: If periodicity is invalid.
+    """
+    if periodicity == "daily":
+        return dt.toordinal()
+
+    if periodicity == "weekly":
+        return (dt.toordinal() - 1) // 7
+
+    raise ValueError("Periodicity must be 'daily' or 'weekly'.")
+
+
 def generate_period_keys(
     start: datetime,
     end: datetime,
@@ -65,24 +103,28 @@ def generate_period_keys(
     if start > end:
         start, end = end, start
 
-    period_keys = []
-
-    current = start
+    start_ordinal = start.toordinal()
+    end_ordinal = end.toordinal()
 
     if periodicity == "daily":
-        while current.date() <= end.date():
-            period_keys.append(current.strftime("%Y-%m-%d"))
-            current += timedelta(days=1)
-        return period_keys
+        return [
+            _format_day(date.fromordinal(ordinal))
+            for ordinal in range(start_ordinal, end_ordinal + 1)
+        ]
 
     if periodicity == "weekly":
         # Normalize to the start of the ISO week (Monday)
-        current = current - timedelta(days=current.weekday())
+        monday_ordinal = start_ordinal - start.weekday()
+
+        iso_year, iso_week, _ = date.fromordinal(monday_ordinal).isocalendar()
 
-        while current <= end:
-            iso_year, iso_week, _ = current.isocalendar()
+        period_keys = []
+        for ordinal in range(monday_ordinal, end_ordinal + 1, 7):
+            if iso_week > 52:
+                # Only some ISO years have a week 53; resync at year end
+                iso_year, iso_week, _ = date.fromordinal(ordinal).isocalendar()
             period_keys.append(f"{iso_year}-{iso_week:02d}")
-            current += timedelta(weeks=1)
+            iso_week += 1
         return period_keys
 
     raise ValueError("Periodicity must be 'daily' or 'weekly'.")